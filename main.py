@@ -3,7 +3,7 @@ Pest Repeller Frequency Controller App
 Enhanced with frequency safety warnings and actual frequency generation
 """
 
-from kivy.lang import Builder
+from kivy.factory import Factory
 from kivy.uix.screenmanager import Screen, ScreenManager
 from kivy.clock import Clock
 from kivy.utils import get_color_from_hex
@@ -12,11 +12,19 @@ from kivy.animation import Animation
 from kivy.app import App
 from kivy.core.audio import SoundLoader
 import numpy as np
-import tempfile
 import os
-import wave
+import struct
 import math
 
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Not available on Android builds
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 from kivymd.app import MDApp
 from kivymd.uix.card import MDCard
 from kivymd.uix.button import MDRaisedButton, MDFlatButton, MDRectangleFlatButton, MDIconButton
@@ -31,88 +39,365 @@ from kivymd.uix.progressbar import MDProgressBar
 from kivymd.uix.card import MDSeparator
 from kivy.properties import StringProperty, NumericProperty, BooleanProperty, ListProperty, DictProperty
 
-# Simple notification function to replace Snackbar
+# Colors parsed once instead of on every KV refresh
+COLOR_AUDIBLE_BG = get_color_from_hex('#FFE5E5')
+COLOR_SAFE_BG = get_color_from_hex('#E8F5E9')
+COLOR_DEFAULT_BG = get_color_from_hex('#FFFFFF')
+COLOR_DANGER = get_color_from_hex('#FF5252')
+COLOR_CAUTION = get_color_from_hex('#FFB74D')
+COLOR_SAFE = get_color_from_hex('#4CAF50')
+LEVEL_RED = [1, 0, 0, 1]
+LEVEL_ORANGE = [1, 0.65, 0, 1]
+LEVEL_GREEN = [0, 0.8, 0, 1]
+MODES = ("Simulation", "Real Device", "Demo")
+MODE_INACTIVE = [0.5, 0.5, 0.5, 0.5]
+
+# Static markup for the Education screen's frequency scale
+FREQ_SCALE_MARKUP = (
+    "0 kHz [color=#2196F3]██████[/color] 20 kHz "
+    "[color=#FF9800]████[/color] 25 kHz "
+    "[color=#4CAF50]████████[/color] 70 kHz"
+)
+
+# Per-zone values indexed by FrequencyControlCard.zone():
+# 0 = audible, 1 = borderline, 2 = ultrasonic
+_CARD_COLORS = (COLOR_AUDIBLE_BG, COLOR_DEFAULT_BG, COLOR_SAFE_BG)
+_CARD_COLORS_QUIET = (COLOR_DEFAULT_BG, COLOR_DEFAULT_BG, COLOR_SAFE_BG)
+_ZONE_COLORS = (COLOR_DANGER, COLOR_CAUTION, COLOR_SAFE)
+_WARNING_OPACITY = (1, 0.7, 0)
+_WARNING_TEXT = (
+    "⚠️ May be audible to humans (especially children)",
+    "⚠️ Borderline range - some people may hear this",
+    "✓ Ultrasonic - Safe for human ears",
+)
+
+# Slider updates are applied at most this often (~20 Hz) while dragging
+FREQ_UPDATE_INTERVAL = 1 / 20
+
+# Tones are regenerated at a new volume only once the slider rests this long
+VOLUME_SETTLE_DELAY = 0.5
+
+# Simple notification function to replace Snackbar; one dialog is reused
+_notification = None
+_notification_timeout = None
+
+
 def show_notification(message, duration=1.5):
     """Show a simple notification using a dialog for now"""
-    dialog = MDDialog(
-        text=message,
-        size_hint=(0.8, None),
-        height=dp(100),
-        buttons=[
-            MDFlatButton(
-                text="OK",
-                on_release=lambda x: dialog.dismiss()
-            )
-        ]
-    )
-    Clock.schedule_once(lambda dt: dialog.dismiss(), duration)
+    global _notification, _notification_timeout
+    dialog = _notification
+    if dialog is None:
+        dialog = _notification = MDDialog(
+            text=message,
+            size_hint=(0.8, None),
+            height=dp(100),
+            buttons=[
+                MDFlatButton(
+                    text="OK",
+                    on_release=lambda x: dialog.dismiss()
+                )
+            ]
+        )
+    elif dialog._is_open:
+        # Still shown or fading out: close it at once so the fade cannot
+        # remove it again, and reopen so on_open resizes it for the new text
+        Animation.cancel_all(dialog, '_anim_alpha')
+        dialog.dismiss(animation=False)
+        dialog.text = message
+    else:
+        dialog.text = message
+    
+    # Each new message restarts the timeout instead of stacking dialogs
+    if _notification_timeout is not None:
+        _notification_timeout.cancel()
+    _notification_timeout = Clock.schedule_once(lambda dt: dialog.dismiss(), duration)
     dialog.open()
 
+# RIFF/WAVE header for mono 16-bit PCM; only the two size fields vary
+_WAV_HEADER_FMT = '<4sI4s4sIHHIIHH4sI'
+
+
+def wav_header(data_size, sample_rate):
+    """Build the 44-byte header for a mono 16-bit PCM WAV file"""
+    return struct.pack(
+        _WAV_HEADER_FMT,
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b'data', data_size
+    )
+
+# One cycle of a unit sine; the non-Numba path gathers from it instead of
+# calling sin, which lacks a vectorized implementation on some ARM builds
+_SIN_LUT_SIZE = 4096
+_SIN_LUT = np.sin(
+    np.arange(_SIN_LUT_SIZE, dtype=np.float64) * (2 * math.pi / _SIN_LUT_SIZE)
+).astype(np.float32)
+
+def _lut_sines(frequencies_hz, samples, sample_rate):
+    """Unit sines gathered from _SIN_LUT, one row per integer frequency"""
+    # Exact integer phase, rounded to the nearest table entry
+    steps = np.array(frequencies_hz, dtype=np.int64)[:, None] * _SIN_LUT_SIZE
+    index = np.arange(samples, dtype=np.int64) * steps
+    index += sample_rate // 2
+    index //= sample_rate
+    index &= _SIN_LUT_SIZE - 1
+    return _SIN_LUT[index]
+
+@njit(cache=True, fastmath=True)
+def _fill_sine_i16(out, frequency, sample_rate, amplitude):
+    """Write a sine of the given amplitude straight into an int16 buffer"""
+    k = 2.0 * math.pi * frequency / sample_rate
+    for i in range(out.size):
+        out[i] = int(amplitude * 32767 * math.sin(k * i))
+
+@njit(cache=True, fastmath=True)
+def _mix_sines(out, frequencies, sample_rate):
+    """Sum unit sines of several frequencies into a float32 buffer"""
+    out[:] = 0.0
+    for frequency in frequencies:
+        k = 2.0 * math.pi * frequency / sample_rate
+        for i in range(out.size):
+            out[i] += math.sin(k * i)
+
 # Tone generator class
 class ToneGenerator:
-    def __init__(self):
+    sample_rate = 44100
+    amplitude_step = 0.05
+    # Android's MediaPlayer leaves a gap at every loop restart, so loops
+    # must be long enough for that gap not to dominate the tone
+    min_loop_seconds = 0.5
+    # Bump whenever the synthesis changes so stale cached files are dropped
+    cache_format = 2
+    
+    def __init__(self, cache_dir, amplitude=0.25):
         self.sounds = {}
-        self.temp_files = []
+        self.file_cache = {}
+        self.stop_events = {}
+        self.cache_dir = cache_dir
+        self.amplitude = self.quantize_amplitude(amplitude)
+        # Numba and the sine table produce slightly different samples
+        self.file_prefix = f'v{self.cache_format}{"n" if HAVE_NUMBA else "t"}_'
+        os.makedirs(cache_dir, exist_ok=True)
+        self.prune_cache()
+    
+    def prune_cache(self):
+        """Delete cached files other than single tones at the current format and amplitude"""
+        prefix = self.file_prefix + 'tone_'
+        suffix = f'_a{self.amplitude:.2f}.wav'
+        for entry in os.listdir(self.cache_dir):
+            if entry.startswith(prefix) and entry.endswith(suffix):
+                continue
+            try:
+                os.unlink(os.path.join(self.cache_dir, entry))
+            except OSError:
+                pass
     
-    def generate_tone(self, frequency_khz, duration=1.0):
-        """Generate a tone at specified frequency in kHz"""
-        frequency = frequency_khz * 1000  # Convert to Hz
-        sample_rate = 44100
-        samples = int(sample_rate * duration)
+    def quantize_amplitude(self, amplitude):
+        """Snap amplitude to a coarse grid so small volume moves share files"""
+        return round(round(amplitude / self.amplitude_step) * self.amplitude_step, 2)
+    
+    def set_amplitude(self, amplitude):
+        """Change the amplitude baked into the PCM; True if sounds were reset"""
+        amplitude = self.quantize_amplitude(amplitude)
+        if amplitude == self.amplitude:
+            return False
+        self.cleanup()
+        self.amplitude = amplitude
+        return True
+    
+    def tone_path(self, frequency_khz):
+        """Deterministic WAV path for a tone, or a mix when given a tuple"""
+        if isinstance(frequency_khz, tuple):
+            name = 'mix_' + '_'.join(f'{f:g}' for f in frequency_khz)
+        else:
+            name = f'tone_{frequency_khz:g}'
+        return os.path.join(
+            self.cache_dir, f'{self.file_prefix}{name}_a{self.amplitude:.2f}.wav'
+        )
+    
+    def cached_file(self, frequency_khz):
+        """Path of an already generated WAV, including ones from earlier runs"""
+        path = self.file_cache.get(frequency_khz)
+        if path is None:
+            path = self.tone_path(frequency_khz)
+            if not os.path.exists(path):
+                return None
+            self.file_cache[frequency_khz] = path
+        return path
+    
+    def period_samples(self, frequency_khz):
+        """Shortest buffer length holding a whole number of cycles"""
+        frequency = int(round(frequency_khz * 1000))  # Convert to Hz
+        return self.sample_rate // math.gcd(self.sample_rate, frequency)
+    
+    def loop_samples(self, period):
+        """Whole number of periods lasting at least min_loop_seconds"""
+        minimum = int(self.sample_rate * self.min_loop_seconds)
+        return period * -(-minimum // period)
+    
+    def generate_tone(self, frequency_khz):
+        """Generate a seamless loop of a tone at specified frequency in kHz"""
+        path = self.cached_file(frequency_khz)
+        if path is not None:
+            return path
         
-        # Generate sine wave
-        t = np.linspace(0, duration, samples, False)
-        wave_data = 0.5 * np.sin(2 * np.pi * frequency * t)
+        frequency = frequency_khz * 1000  # Convert to Hz
+        sample_rate = self.sample_rate
+        samples = self.loop_samples(self.period_samples(frequency_khz))
         
-        # Convert to 16-bit integers
-        wave_data = (wave_data * 32767).astype(np.int16)
+        if HAVE_NUMBA:
+            # Fused sin, scale and cast with no temporary arrays
+            wave_data = np.empty(samples, dtype=np.int16)
+            _fill_sine_i16(wave_data, frequency, sample_rate, self.amplitude)
+            return self.save_tone(frequency_khz, wave_data)
         
-        # Create temporary WAV file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-        temp_file.close()
+        wave = _lut_sines([round(frequency)], samples, sample_rate)[0]
+        np.multiply(wave, np.float32(self.amplitude * 32767), out=wave)
         
-        # Write WAV file
-        with wave.open(temp_file.name, 'wb') as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)   # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(wave_data.tobytes())
+        # Convert to 16-bit integers
+        return self.save_tone(frequency_khz, wave.astype(np.int16, copy=False))
+    
+    def generate_tones(self, frequencies_khz):
+        """Generate several tones at once with a single broadcast"""
+        frequencies_khz = [f for f in dict.fromkeys(frequencies_khz)
+                           if self.cached_file(f) is None]
+        if not frequencies_khz:
+            return
         
-        self.temp_files.append(temp_file.name)
-        return temp_file.name
+        lengths = [self.loop_samples(self.period_samples(f)) for f in frequencies_khz]
+        if HAVE_NUMBA:
+            # Wrap the phase in exact integers so every loop closes cleanly
+            freqs = np.array([round(f * 1000) for f in frequencies_khz], dtype=np.int64)
+            cycles = np.outer(freqs, np.arange(max(lengths), dtype=np.int64))
+            cycles %= self.sample_rate
+            phases = cycles.astype(np.float32)
+            phases *= np.float32(2 * math.pi / self.sample_rate)
+            np.sin(phases, out=phases)
+        else:
+            phases = _lut_sines([round(f * 1000) for f in frequencies_khz],
+                                max(lengths), self.sample_rate)
+        np.multiply(phases, np.float32(self.amplitude * 32767), out=phases)
+        pcm = phases.astype(np.int16)
+        
+        # Each row only needs its own loop length; the rest is padding
+        for frequency_khz, samples, row in zip(frequencies_khz, lengths, pcm):
+            self.save_tone(frequency_khz, row[:samples])
+    
+    def generate_mix(self, frequencies_khz):
+        """Generate one seamless loop holding the sum of several tones"""
+        key = tuple(sorted(set(frequencies_khz)))
+        path = self.cached_file(key)
+        if path is not None:
+            return path
+        
+        # Every period divides the sample rate, so their lcm is at most 1 s
+        samples = self.loop_samples(math.lcm(*(self.period_samples(f) for f in key)))
+        
+        if HAVE_NUMBA:
+            # Accumulate in place instead of materializing a row per tone
+            mix = np.empty(samples, dtype=np.float32)
+            _mix_sines(mix, np.array(key, dtype=np.float64) * 1000, self.sample_rate)
+        else:
+            sines = _lut_sines([round(f * 1000) for f in key], samples, self.sample_rate)
+            mix = sines.sum(axis=0)
+        
+        # Normalize to the same peak as a single tone
+        mix *= np.float32(self.amplitude * 32767) / np.abs(mix).max()
+        return self.save_tone(key, mix.astype(np.int16))
+    
+    def save_tone(self, frequency_khz, wave_data):
+        """Write 16-bit samples to a WAV file and remember it for frequency_khz"""
+        path = self.tone_path(frequency_khz)
+        partial = path + '.part'
+        
+        # Write the samples straight from the array's buffer, then move the
+        # file into place so an interrupted write never leaves a truncated file
+        wave_data = np.ascontiguousarray(wave_data, dtype=np.int16)
+        with open(partial, 'wb') as wav_file:
+            wav_file.write(wav_header(wave_data.nbytes, self.sample_rate))
+            wav_file.write(memoryview(wave_data))
+        os.replace(partial, path)
+        
+        self.file_cache[frequency_khz] = path
+        return path
+    
+    def load_sound(self, frequency_khz):
+        """Return the looping Sound for frequency_khz, loading it only once"""
+        sound = self.sounds.get(frequency_khz)
+        if sound is None:
+            if isinstance(frequency_khz, tuple):
+                filename = self.generate_mix(frequency_khz)
+            else:
+                filename = self.generate_tone(frequency_khz)
+            sound = SoundLoader.load(filename)
+            if not sound:
+                return None
+            # Volume is already baked into the samples
+            sound.volume = 1.0
+            sound.loop = True
+            self.sounds[frequency_khz] = sound
+        return sound
+    
+    def preload(self, frequencies_khz):
+        """Generate and load sounds up front so playback never touches disk"""
+        frequencies_khz = list(frequencies_khz)
+        self.generate_tones(frequencies_khz)
+        for frequency_khz in frequencies_khz:
+            self.load_sound(frequency_khz)
     
     def play_tone(self, frequency_khz, duration=1.0):
-        """Play a tone at specified frequency"""
-        if frequency_khz in self.sounds:
-            if self.sounds[frequency_khz].state == 'play':
-                self.sounds[frequency_khz].stop()
+        """Loop a tone at specified frequency for duration seconds"""
+        sound = self.load_sound(frequency_khz)
+        if sound is None:
+            return False
+        if sound.state == 'play':
+            sound.stop()
         
-        filename = self.generate_tone(frequency_khz, duration)
-        sound = SoundLoader.load(filename)
-        if sound:
-            sound.volume = 0.5
-            sound.play()
-            self.sounds[frequency_khz] = sound
-            return True
-        return False
+        if frequency_khz in self.stop_events:
+            self.stop_events[frequency_khz].cancel()
+        sound.play()
+        self.stop_events[frequency_khz] = Clock.schedule_once(
+            lambda dt: sound.stop(), duration
+        )
+        return True
+    
+    def play_mix(self, frequencies_khz):
+        """Loop the combined tone of several frequencies until stopped"""
+        sound = self.load_sound(tuple(sorted(set(frequencies_khz))))
+        if sound is None:
+            return False
+        if sound.state == 'play':
+            sound.stop()
+        sound.play()
+        return True
+    
+    def timed_tone_playing(self):
+        """True while a play_tone() call is still sounding"""
+        return any(self.sounds[freq].state == 'play' for freq in self.stop_events)
     
     def stop_tone(self, frequency_khz=None):
         """Stop playing tone(s)"""
-        if frequency_khz and frequency_khz in self.sounds:
-            self.sounds[frequency_khz].stop()
-        else:
-            for sound in self.sounds.values():
+        for freq, sound in self.sounds.items():
+            if frequency_khz is None or freq == frequency_khz:
+                if freq in self.stop_events:
+                    self.stop_events.pop(freq).cancel()
                 sound.stop()
     
     def cleanup(self):
-        """Clean up temporary files"""
+        """Release loaded sounds and delete mixes; single tones stay cached"""
+        self.stop_tone()
         for sound in self.sounds.values():
-            sound.stop()
-        for temp_file in self.temp_files:
-            try:
-                os.unlink(temp_file)
-            except:
-                pass
+            sound.unload()
+        self.sounds.clear()
+        
+        # Each set of active pests has its own mix, so they are not worth keeping
+        for key, path in self.file_cache.items():
+            if isinstance(key, tuple):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+        self.file_cache.clear()
 
 
 class FrequencyControlCard(MDCard):
@@ -126,65 +411,76 @@ class FrequencyControlCard(MDCard):
     audible_threshold = NumericProperty(23)
     safe_threshold = NumericProperty(25)
     
+    # (current_freq, value) pairs, refreshed only when the frequency moves
+    _intensity_cache = (None, 0)
+    _safety_cache = (None, 0)
+    _intensity_k = 0.0
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.app = App.get_running_app()
+        
+        # One pulsing animation per card, started and cancelled as needed
+        self._warn_anim = Animation(opacity=0.8, duration=0.5) + Animation(opacity=1, duration=0.5)
+        self._warn_anim.repeat = True
+        self._warning_active = False
+        
+        # Slider drags are coalesced into at most one update per frame slot
+        self._pending_freq = None
+        self._throttle_ev = None
     
-    def get_card_color(self):
-        if self.in_audible_range() and self.app.show_warnings:
-            return get_color_from_hex('#FFE5E5')
-        elif self.current_freq > self.safe_threshold:
-            return get_color_from_hex('#E8F5E9')
-        return get_color_from_hex('#FFFFFF')
+    # KV passes the properties these depend on as arguments so the bindings
+    # refresh on changes. They run while the KV rule is applied, before
+    # self.app is set, so show_warnings must come from the argument
+    def get_card_color(self, current_freq, show_warnings):
+        colors = _CARD_COLORS if show_warnings else _CARD_COLORS_QUIET
+        return colors[self.zone()]
+    
+    def zone(self):
+        """0 if audible, 1 if borderline, 2 if safely ultrasonic"""
+        freq = self.current_freq
+        return (freq > self.audible_threshold) + (freq > self.safe_threshold)
     
     def in_audible_range(self):
         return self.current_freq <= self.audible_threshold
     
-    def get_warning_color(self):
-        if self.in_audible_range():
-            return get_color_from_hex('#FF5252')
-        elif self.current_freq <= self.safe_threshold:
-            return get_color_from_hex('#FFB74D')
-        return get_color_from_hex('#4CAF50')
-    
-    def get_warning_opacity(self):
-        if self.in_audible_range() and self.app.show_warnings:
-            return 1
-        elif self.current_freq <= self.safe_threshold and self.app.show_warnings:
-            return 0.7
-        return 0
-    
-    def get_warning_text(self):
-        if self.in_audible_range():
-            return "⚠️ May be audible to humans (especially children)"
-        elif self.current_freq <= self.safe_threshold:
-            return "⚠️ Borderline range - some people may hear this"
-        return "✓ Ultrasonic - Safe for human ears"
-    
-    def get_slider_color(self):
-        if self.in_audible_range():
-            return get_color_from_hex('#FF5252')
-        elif self.current_freq <= self.safe_threshold:
-            return get_color_from_hex('#FFB74D')
-        return get_color_from_hex('#4CAF50')
-    
-    def get_intensity_color(self):
+    def get_warning_color(self, current_freq):
+        return _ZONE_COLORS[self.zone()]
+    
+    def get_warning_opacity(self, current_freq, show_warnings):
+        if not show_warnings:
+            return 0
+        return _WARNING_OPACITY[self.zone()]
+    
+    def get_warning_text(self, current_freq):
+        return _WARNING_TEXT[self.zone()]
+    
+    def get_slider_color(self, current_freq):
+        return _ZONE_COLORS[self.zone()]
+    
+    def get_intensity_color(self, current_freq):
         intensity = self.calculate_intensity()
         if intensity > 80:
-            return [1, 0, 0, 1]
+            return LEVEL_RED
         elif intensity > 50:
-            return [1, 0.65, 0, 1]
-        return [0, 0.8, 0, 1]
+            return LEVEL_ORANGE
+        return LEVEL_GREEN
     
-    def get_safety_color(self):
+    def get_safety_color(self, current_freq):
         safety = self.calculate_safety_score()
         if safety > 80:
-            return [0, 0.8, 0, 1]
+            return LEVEL_GREEN
         elif safety > 50:
-            return [1, 0.65, 0, 1]
-        return [1, 0, 0, 1]
+            return LEVEL_ORANGE
+        return LEVEL_RED
     
     def calculate_safety_score(self):
+        freq = self.current_freq
+        if self._safety_cache[0] != freq:
+            self._safety_cache = (freq, self._compute_safety_score())
+        return self._safety_cache[1]
+    
+    def _compute_safety_score(self):
         if self.current_freq >= self.safe_threshold:
             return 100
         elif self.current_freq <= self.audible_threshold:
@@ -257,26 +553,56 @@ class FrequencyControlCard(MDCard):
             self.show_notification(f"{self.pest_name} repeller deactivated")
     
     def on_freq_change(self, slider, value):
-        self.current_freq = int(value)
+        self._pending_freq = int(value)
+        if self._throttle_ev is None:
+            self._throttle_ev = Clock.schedule_once(self._apply_freq, FREQ_UPDATE_INTERVAL)
+    
+    def _apply_freq(self, dt):
+        self._throttle_ev = None
+        self.current_freq = self._pending_freq
         self.update_bars()
-        
-        if self.app.show_warnings and self.in_audible_range():
-            anim = Animation(opacity=0.8, duration=0.5) + Animation(opacity=1, duration=0.5)
-            anim.repeat = True
-            anim.start(self)
+        self.update_warning_pulse()
+    
+    def update_warning_pulse(self):
+        """Start or stop the audible-range pulse to match the current state"""
+        should_warn = self.app.show_warnings and self.in_audible_range()
+        if should_warn and not self._warning_active:
+            self._warn_anim.start(self)
+            self._warning_active = True
+        elif not should_warn and self._warning_active:
+            self._warn_anim.cancel(self)
+            self._warning_active = False
+            self.opacity = 1
     
     def update_bars(self):
-        self.ids.intensity_bar.value = self.calculate_intensity()
-        self.ids.safety_bar.value = self.calculate_safety_score()
+        # Only touch the bars when the value changes, to skip needless redraws
+        intensity = self.calculate_intensity()
+        bar = self.ids.intensity_bar
+        if bar.value != intensity:
+            bar.value = intensity
+        
+        safety = self.calculate_safety_score()
+        bar = self.ids.safety_bar
+        if bar.value != safety:
+            bar.value = safety
     
     def calculate_intensity(self):
+        freq = self.current_freq
+        if self._intensity_cache[0] != freq:
+            self._intensity_cache = (freq, self._compute_intensity())
+        return self._intensity_cache[1]
+    
+    def _compute_intensity(self):
+        x = (self.current_freq - self.optimal_freq) * self._intensity_k
+        return int(100.0 * math.exp(-x * x))
+    
+    def on_min_freq(self, instance, value):
+        # Range is fixed per card, so fold the normalization into one factor
         range_size = self.max_freq - self.min_freq
-        if range_size == 0:
-            return 100
-        position = (self.current_freq - self.min_freq) / range_size
-        optimal_pos = (self.optimal_freq - self.min_freq) / range_size
-        intensity = 100 * math.exp(-((position - optimal_pos) * 5) ** 2)
-        return int(intensity)
+        self._intensity_k = 5.0 / range_size if range_size else 0.0
+        self._intensity_cache = (None, 0)
+    
+    on_max_freq = on_optimal_freq = on_min_freq
     
     def test_frequency(self):
         if self.is_active:
@@ -321,11 +647,31 @@ class SettingsScreen(Screen):
     pass
 
 
+class PestInfoCard(MDCard):
+    pest_name = StringProperty()
+    freq_range = StringProperty()
+    note = StringProperty()
+    note_color = StringProperty("Primary")
+
+
 class EducationScreen(Screen):
-    pass
+    # Rows for the pest RecycleView; only the visible cards are instantiated
+    pest_info = ListProperty([
+        {'pest_name': 'Mosquitoes', 'freq_range': '38-44 kHz',
+         'note': '✓ Ultrasonic range', 'note_color': 'Primary'},
+        {'pest_name': 'Rats', 'freq_range': '20-35 kHz',
+         'note': '⚠️ Lower range audible', 'note_color': 'Error'},
+        {'pest_name': 'Cockroaches', 'freq_range': '25-45 kHz',
+         'note': '✓ Mostly ultrasonic', 'note_color': 'Primary'},
+        {'pest_name': 'Spiders', 'freq_range': '30-60 kHz',
+         'note': '✓ Ultrasonic range', 'note_color': 'Primary'},
+    ])
 
 
 class PestRepellerApp(MDApp):
+    FREQ_SCALE_MARKUP = FREQ_SCALE_MARKUP
+    MODE_INACTIVE = MODE_INACTIVE
+    
     master_volume = NumericProperty(0.5)
     sound_enabled = BooleanProperty(True)
     show_warnings = BooleanProperty(True)
@@ -333,6 +679,9 @@ class PestRepellerApp(MDApp):
     operation_mode = StringProperty("Simulation")
     is_repelling = BooleanProperty(False)
     
+    # Mode button backgrounds keyed by mode, refreshed only when the mode changes
+    mode_colors = DictProperty({})
+    
     pest_data = ListProperty([
         {
             'name': 'Mosquitoes',
@@ -382,22 +731,36 @@ class PestRepellerApp(MDApp):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.tone_generator = ToneGenerator()
-        self.repelling_event = None
+        self.tone_generator = ToneGenerator(
+            os.path.join(self.user_data_dir, 'tones'),
+            amplitude=self.master_volume * 0.5
+        )
+        self._repelling_frequencies = ()
+        self._cards = {}
+        self._volume_settled = Clock.create_trigger(self._apply_volume, VOLUME_SETTLE_DELAY)
     
     def build(self):
         self.theme_cls.primary_palette = "Teal"
         self.theme_cls.theme_style = "Light"
+        self.update_mode_colors()
         
         for pest in self.pest_data:
             self.active_pests[pest['name']] = False
         
-        return Builder.load_string(KV)
+        self.preload_tones()
+        
+        # pestrepeller.kv is loaded by App.load_kv() just before build()
+        return Factory.MainRoot()
+    
+    def preload_tones(self):
+        # Warm the sound cache so the repelling loop never synthesizes or loads
+        self.tone_generator.preload(pest['optimal'] for pest in self.pest_data)
     
     def on_start(self):
         self.update_pest_list()
     
     def on_stop(self):
+        self._volume_settled.cancel()
         self.stop_repelling()
         self.tone_generator.cleanup()
     
@@ -405,9 +768,14 @@ class PestRepellerApp(MDApp):
         if hasattr(self.root, 'get_screen'):
             main_screen = self.root.get_screen('main')
             container = main_screen.ids.pests_container
-            container.clear_widgets()
             
             for pest in self.pest_data:
+                card = self._cards.get(pest['name'])
+                if card is not None:
+                    card.current_freq = pest['optimal']
+                    card.is_active = self.active_pests.get(pest['name'], False)
+                    continue
+                
                 card = FrequencyControlCard(
                     pest_name=pest['name'],
                     icon=pest['icon'],
@@ -417,17 +785,16 @@ class PestRepellerApp(MDApp):
                     current_freq=pest['optimal'],
                     is_active=self.active_pests.get(pest['name'], False)
                 )
+                self._cards[pest['name']] = card
                 container.add_widget(card)
     
     def toggle_all_pests(self, activate):
         for pest in self.pest_data:
             self.active_pests[pest['name']] = activate
         
-        main_screen = self.root.get_screen('main')
-        for child in main_screen.ids.pests_container.children:
-            if isinstance(child, FrequencyControlCard):
-                child.is_active = activate
-                child.ids.checkbox.active = activate
+        for card in self._cards.values():
+            card.is_active = activate
+            card.ids.checkbox.active = activate
         
         status = "activated" if activate else "deactivated"
         show_notification(f"All repellers {status}")
@@ -437,19 +804,17 @@ class PestRepellerApp(MDApp):
             return
         
         # First, update active_pests dictionary from current checkbox states
-        main_screen = self.root.get_screen('main')
         active_frequencies = []
         audible_count = 0
         
-        for child in main_screen.ids.pests_container.children:
-            if isinstance(child, FrequencyControlCard):
-                # Update the active_pests dictionary with current checkbox state
-                self.active_pests[child.pest_name] = child.is_active
-                
-                if child.is_active:
-                    if child.in_audible_range():
-                        audible_count += 1
-                    active_frequencies.append(child.current_freq)
+        for card in self._cards.values():
+            # Update the active_pests dictionary with current checkbox state
+            self.active_pests[card.pest_name] = card.is_active
+            
+            if card.is_active:
+                if card.in_audible_range():
+                    audible_count += 1
+                active_frequencies.append(card.current_freq)
         
         active_count = len(active_frequencies)
         
@@ -473,27 +838,14 @@ class PestRepellerApp(MDApp):
             dialog.open()
             
             if self.sound_enabled and active_frequencies:
-                self.repelling_event = Clock.schedule_interval(
-                    lambda dt: self.play_next_frequency(active_frequencies), 
-                    2.0
-                )
+                self._repelling_frequencies = tuple(active_frequencies)
+                self.tone_generator.play_mix(active_frequencies)
         else:
             show_notification("No pests selected for repelling")
     
-    def play_next_frequency(self, frequencies):
-        if not self.is_repelling:
-            return False
-            
-        import random
-        freq = random.choice(frequencies)
-        self.play_frequency(freq, duration=1.5)
-        return True
-    
     def stop_repelling(self):
         self.is_repelling = False
-        if self.repelling_event:
-            self.repelling_event.cancel()
-            self.repelling_event = None
+        self._repelling_frequencies = ()
         self.tone_generator.stop_tone()
         show_notification("Repelling stopped")
     
@@ -567,6 +919,22 @@ class PestRepellerApp(MDApp):
     
     def set_volume(self, value):
         self.master_volume = value
+        # Debounced so dragging the slider never reloads sounds mid-drag
+        self._volume_settled.cancel()
+        self._volume_settled()
+    
+    def _apply_volume(self, dt):
+        if self.tone_generator.timed_tone_playing():
+            # Let a test tone finish before its Sound is unloaded
+            self._volume_settled()
+            return
+        
+        # Regenerates tones only when the quantized amplitude actually moves
+        if not self.tone_generator.set_amplitude(self.master_volume * 0.5):
+            return
+        self.preload_tones()
+        if self._repelling_frequencies:
+            self.tone_generator.play_mix(self._repelling_frequencies)
     
     def toggle_sound(self, enabled):
         self.sound_enabled = enabled
@@ -575,13 +943,22 @@ class PestRepellerApp(MDApp):
     
     def toggle_warnings(self, enabled):
         self.show_warnings = enabled
-        self.update_pest_list()
+        for card in self._cards.values():
+            card.update_warning_pulse()
     
     def toggle_tooltips(self, enabled):
         self.show_tooltips = enabled
     
+    def update_mode_colors(self):
+        primary = self.theme_cls.primary_color
+        self.mode_colors = {
+            mode: primary if mode == self.operation_mode else MODE_INACTIVE
+            for mode in MODES
+        }
+    
     def change_mode(self, mode_text):
         self.operation_mode = mode_text
+        self.update_mode_colors()
         show_notification(f"Mode changed to: {mode_text}")
     
     def dismiss_dialog(self):
@@ -589,547 +966,5 @@ class PestRepellerApp(MDApp):
             self.dialog.dismiss()
 
 
-KV = '''
-<FrequencyControlCard>:
-    orientation: 'vertical'
-    padding: dp(16)
-    spacing: dp(8)
-    size_hint_y: None
-    height: dp(280)
-    elevation: 2
-    radius: [dp(15)]
-    md_bg_color: self.get_card_color()
-    
-    MDBoxLayout:
-        size_hint_y: 0.15
-        pos_hint: {"top": 1}
-        
-        MDIcon:
-            icon: root.icon
-            size_hint_x: 0.15
-            pos_hint: {"center_y": 0.5}
-            
-        MDLabel:
-            text: root.pest_name
-            font_style: "H6"
-            size_hint_x: 0.6
-            halign: 'left'
-            
-        MDBoxLayout:
-            size_hint_x: 0.25
-            spacing: dp(4)
-            pos_hint: {"center_y": 0.5}
-            
-            MDIconButton:
-                icon: "information-outline"
-                on_release: root.show_frequency_info()
-                theme_text_color: "Hint"
-                
-            MDCheckbox:
-                id: checkbox
-                size_hint_x: 0.5
-                active: root.is_active
-                on_active: root.on_checkbox_active(*args)
-    
-    MDCard:
-        size_hint_y: 0.1
-        md_bg_color: root.get_warning_color()
-        padding: dp(8)
-        radius: [dp(8)]
-        opacity: root.get_warning_opacity()
-        
-        MDBoxLayout:
-            MDIcon:
-                icon: "ear-hearing"
-                size_hint_x: 0.15
-                theme_text_color: "Custom"
-                text_color: 1, 1, 1, 1 if root.in_audible_range() else 0
-                
-            MDLabel:
-                text: root.get_warning_text()
-                font_style: "Caption"
-                theme_text_color: "Custom"
-                text_color: 1, 1, 1, 1
-                halign: 'center'
-    
-    MDBoxLayout:
-        size_hint_y: 0.15
-        pos_hint: {"center_y": 0.5}
-        
-        MDIcon:
-            icon: "wave"
-            size_hint_x: 0.15
-            
-        MDBoxLayout:
-            orientation: 'vertical'
-            size_hint_x: 0.85
-            
-            MDBoxLayout:
-                MDLabel:
-                    text: f"Current: {int(root.current_freq)} kHz"
-                    font_style: "Subtitle2"
-                    
-                MDLabel:
-                    text: f"Range: {root.min_freq}-{root.max_freq} kHz"
-                    font_style: "Caption"
-                    theme_text_color: "Hint"
-                    halign: 'right'
-            
-            MDBoxLayout:
-                MDLabel:
-                    text: f"Optimal: {root.optimal_freq} kHz"
-                    font_style: "Caption"
-                    theme_text_color: "Secondary"
-    
-    MDSlider:
-        id: slider
-        min: root.min_freq
-        max: root.max_freq
-        value: root.current_freq
-        step: 1
-        size_hint_y: 0.15
-        on_value: root.on_freq_change(*args)
-        color: root.get_slider_color()
-    
-    MDBoxLayout:
-        size_hint_y: 0.2
-        spacing: dp(8)
-        
-        MDBoxLayout:
-            orientation: 'vertical'
-            size_hint_x: 0.5
-            
-            MDLabel:
-                text: "Effectiveness"
-                font_style: "Caption"
-                halign: 'center'
-                
-            MDProgressBar:
-                id: intensity_bar
-                value: root.calculate_intensity()
-                max: 100
-                color: root.get_intensity_color()
-        
-        MDBoxLayout:
-            orientation: 'vertical'
-            size_hint_x: 0.5
-            
-            MDLabel:
-                text: "Safety Level"
-                font_style: "Caption"
-                halign: 'center'
-                
-            MDProgressBar:
-                id: safety_bar
-                value: root.calculate_safety_score()
-                max: 100
-                color: root.get_safety_color()
-    
-    MDBoxLayout:
-        size_hint_y: 0.15
-        spacing: dp(8)
-        
-        MDRaisedButton:
-            text: "Test"
-            on_release: root.test_frequency()
-            md_bg_color: app.theme_cls.primary_color
-            size_hint_x: 0.5
-            
-        MDRectangleFlatButton:
-            text: "Optimal"
-            on_release: root.reset_to_optimal()
-            size_hint_x: 0.25
-            
-        MDRectangleFlatButton:
-            text: "Safe"
-            on_release: root.reset_to_safe()
-            size_hint_x: 0.25
-            disabled: not root.has_safe_mode()
-
-<MainScreen>:
-    name: 'main'
-    
-    BoxLayout:
-        orientation: 'vertical'
-        spacing: dp(8)
-        padding: dp(16)
-        
-        MDTopAppBar:
-            title: "Pest Repeller Controller"
-            elevation: 4
-            pos_hint: {"top": 1}
-            left_action_items: [["menu", lambda x: app.open_drawer()]]
-            right_action_items: [["cog", lambda x: app.open_settings()], ["school", lambda x: app.open_education()], ["information", lambda x: app.show_info()]]
-        
-        MDScrollView:
-            MDGridLayout:
-                id: pests_container
-                cols: 1
-                spacing: dp(16)
-                padding: dp(8)
-                size_hint_y: None
-                height: self.minimum_height
-                adaptive_height: True
-        
-        MDBoxLayout:
-            size_hint_y: 0.15
-            spacing: dp(8)
-            padding: [dp(8), dp(8)]
-            adaptive_height: False
-            height: dp(60)
-            pos_hint: {"bottom": 1}
-            
-            MDRaisedButton:
-                text: "ACTIVATE ALL"
-                on_release: app.toggle_all_pests(True)
-                icon: "power"
-                size_hint_x: 0.25
-                
-            MDRaisedButton:
-                text: "DEACTIVATE ALL"
-                on_release: app.toggle_all_pests(False)
-                icon: "power-off"
-                size_hint_x: 0.25
-                
-            MDRaisedButton:
-                text: "START"
-                on_release: app.start_repelling()
-                md_bg_color: 0.2, 0.7, 0.3, 1
-                icon: "play"
-                size_hint_x: 0.25
-                
-            MDRaisedButton:
-                text: "STOP"
-                on_release: app.stop_repelling()
-                md_bg_color: 0.9, 0.2, 0.2, 1
-                icon: "stop"
-                size_hint_x: 0.25
-
-<SettingsScreen>:
-    name: 'settings'
-    
-    BoxLayout:
-        orientation: 'vertical'
-        
-        MDTopAppBar:
-            title: "Settings"
-            elevation: 4
-            left_action_items: [["arrow-left", lambda x: app.go_back()]]
-        
-        MDScrollView:
-            MDGridLayout:
-                cols: 1
-                spacing: dp(8)
-                padding: dp(16)
-                size_hint_y: None
-                height: self.minimum_height
-                adaptive_height: True
-                
-                MDCard:
-                    orientation: 'vertical'
-                    padding: dp(16)
-                    size_hint_y: None
-                    height: dp(280)
-                    
-                    MDLabel:
-                        text: "Sound Settings"
-                        font_style: "H6"
-                    
-                    MDBoxLayout:
-                        size_hint_y: None
-                        height: dp(48)
-                        
-                        MDIcon:
-                            icon: "volume-high"
-                        MDLabel:
-                            text: "Master Volume"
-                        MDSlider:
-                            id: volume_slider
-                            min: 0
-                            max: 100
-                            value: app.master_volume * 100
-                            on_value: app.set_volume(args[1]/100)
-                    
-                    MDBoxLayout:
-                        size_hint_y: None
-                        height: dp(48)
-                        
-                        MDCheckbox:
-                            id: sound_check
-                            active: app.sound_enabled
-                            on_active: app.toggle_sound(args[1])
-                        MDLabel:
-                            text: "Enable Sound Effects"
-                    
-                    MDSeparator:
-                        height: dp(1)
-                    
-                    MDLabel:
-                        text: "Safety Warnings"
-                        font_style: "Subtitle1"
-                    
-                    MDBoxLayout:
-                        size_hint_y: None
-                        height: dp(48)
-                        
-                        MDCheckbox:
-                            id: warning_check
-                            active: app.show_warnings
-                            on_active: app.toggle_warnings(args[1])
-                        MDLabel:
-                            text: "Show audible frequency warnings"
-                    
-                    MDBoxLayout:
-                        size_hint_y: None
-                        height: dp(48)
-                        
-                        MDCheckbox:
-                            id: tooltip_check
-                            active: app.show_tooltips
-                            on_active: app.toggle_tooltips(args[1])
-                        MDLabel:
-                            text: "Show educational tooltips"
-                
-                MDCard:
-                    orientation: 'vertical'
-                    padding: dp(16)
-                    size_hint_y: None
-                    height: dp(180)
-                    
-                    MDLabel:
-                        text: "Operation Mode"
-                        font_style: "H6"
-                    
-                    MDRaisedButton:
-                        text: "Simulation"
-                        on_release: app.change_mode("Simulation")
-                        size_hint_x: 0.9
-                        pos_hint: {"center_x": 0.5}
-                        md_bg_color: app.theme_cls.primary_color if app.operation_mode == "Simulation" else [0.5, 0.5, 0.5, 0.5]
-                    
-                    MDRaisedButton:
-                        text: "Real Device"
-                        on_release: app.change_mode("Real Device")
-                        size_hint_x: 0.9
-                        pos_hint: {"center_x": 0.5}
-                        md_bg_color: app.theme_cls.primary_color if app.operation_mode == "Real Device" else [0.5, 0.5, 0.5, 0.5]
-                    
-                    MDRaisedButton:
-                        text: "Demo"
-                        on_release: app.change_mode("Demo")
-                        size_hint_x: 0.9
-                        pos_hint: {"center_x": 0.5}
-                        md_bg_color: app.theme_cls.primary_color if app.operation_mode == "Demo" else [0.5, 0.5, 0.5, 0.5]
-                
-                MDCard:
-                    orientation: 'vertical'
-                    padding: dp(16)
-                    size_hint_y: None
-                    height: dp(200)
-                    
-                    MDLabel:
-                        text: "Frequency Safety Guide"
-                        font_style: "H6"
-                    
-                    MDLabel:
-                        text: "• 20-23 kHz: May be audible to young people"
-                        font_style: "Body2"
-                    
-                    MDLabel:
-                        text: "• 23-25 kHz: Borderline, some may hear"
-                        font_style: "Body2"
-                    
-                    MDLabel:
-                        text: "• 25+ kHz: Ultrasonic (inaudible to humans)"
-                        font_style: "Body2"
-                    
-                    MDLabel:
-                        text: "• 20 kHz is the limit of human hearing"
-                        font_style: "Body2"
-                    
-                    MDRaisedButton:
-                        text: "Learn More"
-                        on_release: app.open_education()
-                        size_hint_x: 0.5
-                        pos_hint: {"center_x": 0.5}
-
-<EducationScreen>:
-    name: 'education'
-    
-    BoxLayout:
-        orientation: 'vertical'
-        
-        MDTopAppBar:
-            title: "Frequency Education"
-            elevation: 4
-            left_action_items: [["arrow-left", lambda x: app.go_back()]]
-        
-        ScrollView:
-            MDGridLayout:
-                cols: 1
-                spacing: dp(16)
-                padding: dp(24)
-                size_hint_y: None
-                height: self.minimum_height
-                adaptive_height: True
-                
-                MDCard:
-                    orientation: 'vertical'
-                    padding: dp(24)
-                    spacing: dp(16)
-                    
-                    MDLabel:
-                        text: "Understanding Ultrasonic Frequencies"
-                        font_style: "H5"
-                        halign: 'center'
-                    
-                    MDLabel:
-                        text: "Human Hearing Range: 20 Hz - 20,000 Hz (20 kHz)"
-                        font_style: "Subtitle1"
-                        theme_text_color: "Secondary"
-                        halign: 'center'
-                    
-                    MDLabel:
-                        text: "[b]Frequency Scale Visualization[/b]"
-                        markup: True
-                        font_style: "Body1"
-                        halign: 'center'
-                    
-                    MDLabel:
-                        text: "0 kHz [color=#2196F3]██████[/color] 20 kHz [color=#FF9800]████[/color] 25 kHz [color=#4CAF50]████████[/color] 70 kHz"
-                        markup: True
-                        font_style: "Body2"
-                        halign: 'center'
-                    
-                    MDSeparator:
-                        height: dp(1)
-                    
-                    MDLabel:
-                        text: "Frequency Zones:"
-                        font_style: "H6"
-                    
-                    MDBoxLayout:
-                        spacing: dp(8)
-                        
-                        MDIcon:
-                            icon: "circle"
-                            theme_text_color: "Custom"
-                            text_color: 0, 0.7, 0.9, 1
-                        
-                        MDLabel:
-                            text: "0-20 kHz: Audible to humans"
-                            font_style: "Body1"
-                    
-                    MDBoxLayout:
-                        spacing: dp(8)
-                        
-                        MDIcon:
-                            icon: "circle"
-                            theme_text_color: "Custom"
-                            text_color: 1, 0.5, 0, 1
-                        
-                        MDLabel:
-                            text: "20-25 kHz: Borderline (audible to some)"
-                            font_style: "Body1"
-                    
-                    MDBoxLayout:
-                        spacing: dp(8)
-                        
-                        MDIcon:
-                            icon: "circle"
-                            theme_text_color: "Custom"
-                            text_color: 0, 0.8, 0, 1
-                        
-                        MDLabel:
-                            text: "25+ kHz: Ultrasonic (inaudible to humans)"
-                            font_style: "Body1"
-                    
-                    MDSeparator:
-                        height: dp(1)
-                    
-                    MDLabel:
-                        text: "Pest-Specific Information"
-                        font_style: "H6"
-                    
-                    MDGridLayout:
-                        cols: 2
-                        spacing: dp(16)
-                        adaptive_height: True
-                        
-                        MDCard:
-                            orientation: 'vertical'
-                            padding: dp(8)
-                            size_hint_y: None
-                            height: dp(120)
-                            
-                            MDLabel:
-                                text: "Mosquitoes"
-                                font_style: "Subtitle2"
-                            MDLabel:
-                                text: "38-44 kHz"
-                                font_style: "Caption"
-                            MDLabel:
-                                text: "✓ Ultrasonic range"
-                                font_style: "Caption"
-                                theme_text_color: "Primary"
-                        
-                        MDCard:
-                            orientation: 'vertical'
-                            padding: dp(8)
-                            size_hint_y: None
-                            height: dp(120)
-                            
-                            MDLabel:
-                                text: "Rats"
-                                font_style: "Subtitle2"
-                            MDLabel:
-                                text: "20-35 kHz"
-                                font_style: "Caption"
-                            MDLabel:
-                                text: "⚠️ Lower range audible"
-                                font_style: "Caption"
-                                theme_text_color: "Error"
-                        
-                        MDCard:
-                            orientation: 'vertical'
-                            padding: dp(8)
-                            size_hint_y: None
-                            height: dp(120)
-                            
-                            MDLabel:
-                                text: "Cockroaches"
-                                font_style: "Subtitle2"
-                            MDLabel:
-                                text: "25-45 kHz"
-                                font_style: "Caption"
-                            MDLabel:
-                                text: "✓ Mostly ultrasonic"
-                                font_style: "Caption"
-                                theme_text_color: "Primary"
-                        
-                        MDCard:
-                            orientation: 'vertical'
-                            padding: dp(8)
-                            size_hint_y: None
-                            height: dp(120)
-                            
-                            MDLabel:
-                                text: "Spiders"
-                                font_style: "Subtitle2"
-                            MDLabel:
-                                text: "30-60 kHz"
-                                font_style: "Caption"
-                            MDLabel:
-                                text: "✓ Ultrasonic range"
-                                font_style: "Caption"
-                                theme_text_color: "Primary"
-
-ScreenManager:
-    MainScreen:
-    SettingsScreen:
-    EducationScreen:
-'''
-
-
 if __name__ == '__main__':
     PestRepellerApp().run()